@@ -1,20 +1,55 @@
 # backend/app/database.py
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey, DateTime, Index
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey, Date, DateTime, Index, event, func
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from datetime import datetime
+import asyncio
 import os
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./database.db")
 
-# Create async engine
+# Connection pool sizing
+POOL_SIZE = 10
+
+# Create async engine with a bounded connection pool so requests reuse
+# connections instead of paying file-open + PRAGMA setup cost every time
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL query logging
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=20,
+    pool_recycle=3600,
+    pool_pre_ping=True,
     connect_args={"check_same_thread": False}  # SQLite specific
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune SQLite for concurrent access on every new connection.
+
+    WAL mode lets dashboard reads run concurrently with assessment writes,
+    and synchronous=NORMAL avoids the double fsync per commit while staying
+    safe in WAL mode. Skipped for in-memory databases (used in tests).
+    """
+    if ":memory:" in DATABASE_URL:
+        return
+    cursor = dbapi_connection.cursor()
+    # page_size only takes effect on a fresh database (before the first
+    # write) or after VACUUM, so it must run before journal_mode
+    cursor.execute("PRAGMA page_size=8192")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    cursor.close()
+
 # Session factory
 SessionLocal = async_sessionmaker(
     engine,
@@ -35,7 +70,9 @@ class Prediction(Base):
     __tablename__ = "predictions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Stamped by SQLite (CURRENT_TIMESTAMP is UTC) so inserts don't ship a
+    # Python-generated timestamp parameter per row
+    created_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
 
     # Prediction results
     risk_level = Column(String, nullable=False, index=True)  # 'low', 'medium', 'high'
@@ -47,7 +84,6 @@ class Prediction(Base):
     # Source tracking
     endpoint = Column(String, nullable=False)  # 'simplified' or 'raw'
 
-
 class AssessmentInput(Base):
     """Stores all form inputs from SimplifiedAssessmentRequest"""
     __tablename__ = "assessment_inputs"
@@ -77,10 +113,41 @@ class AssessmentInput(Base):
     financial_stress = Column(String, nullable=False)
     career_alignment = Column(Integer, nullable=False)
 
-    # Services (arrays stored as JSON text)
-    services_used = Column(Text, nullable=True)  # JSON array
+    # Services (small enumerable sets packed as integer bitmasks; see
+    # SERVICE_BITS / WITHDRAWAL_REASON_BITS below)
+    services_mask = Column(Integer, nullable=False, default=0)
     withdrawal_considered = Column(Boolean, nullable=False)
-    withdrawal_reasons = Column(Text, nullable=True)  # JSON array
+    withdrawal_mask = Column(Integer, nullable=False, default=0)
+
+
+# Bit assignments for AssessmentInput.services_mask (values sent by the
+# assessment form's services step)
+SERVICE_BITS = {
+    "academic": 1,
+    "career": 2,
+    "counseling": 4,
+    "health": 8,
+    "financial": 16,
+    "none": 32,
+}
+
+# Bit assignments for AssessmentInput.withdrawal_mask
+WITHDRAWAL_REASON_BITS = {
+    "Academic difficulty": 1,
+    "Financial challenges": 2,
+    "Mental health": 4,
+    "Personal/family issues": 8,
+    "Lack of interest": 16,
+    "Career opportunities": 32,
+}
+
+
+def pack_bitmask(values, bits) -> int:
+    """Pack a list of enum strings into an integer mask; unknown values are ignored."""
+    mask = 0
+    for value in values or ():
+        mask |= bits.get(value, 0)
+    return mask
 
 
 class RiskFactor(Base):
@@ -95,6 +162,11 @@ class RiskFactor(Base):
     impact = Column(String, nullable=False)  # 'low', 'medium', 'high'
     description = Column(Text, nullable=False)
 
+    # Covering index for the top-risk-factors join + GROUP BY on category
+    __table_args__ = (
+        Index("ix_rf_pred_cat", "prediction_id", "category"),
+    )
+
 
 class Recommendation(Base):
     """Stores personalized recommendations for each prediction"""
@@ -110,20 +182,40 @@ class Recommendation(Base):
     contact = Column(String, nullable=True)
 
 
+class DailyRiskRollup(Base):
+    """
+    Materialized daily counts per risk level, maintained incrementally by
+    save_prediction so dashboard aggregations read O(days) rows instead of
+    scanning the full predictions table.
+    """
+    __tablename__ = "daily_risk_rollup"
+
+    date = Column(Date, primary_key=True)
+    risk_level = Column(String, primary_key=True)  # 'low', 'medium', 'high'
+    count = Column(Integer, nullable=False, default=0)
+    sum_score = Column(Integer, nullable=False, default=0)
+
+
 # ============================================================================
 # Database Initialization
 # ============================================================================
 
 async def init_db():
     """
-    Initialize database by creating all tables.
-    This is called on application startup.
+    Initialize database by creating all tables and pre-warming the
+    connection pool. This is called on application startup.
     """
     async with engine.begin() as conn:
         # Create all tables defined in Base metadata
         await conn.run_sync(Base.metadata.create_all)
         print("[OK] Database tables created successfully")
 
+    # Pre-warm the pool: open pool_size connections up front so the first
+    # requests don't pay connect + PRAGMA setup cost
+    connections = await asyncio.gather(*[engine.connect() for _ in range(POOL_SIZE)])
+    for conn in connections:
+        await conn.close()
+
 
 async def get_db():
     """
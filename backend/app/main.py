@@ -1,17 +1,47 @@
 # backend/app/main.py
+import asyncio
+import logging
+import logging.handlers
+import queue
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.models.schemas import HealthResponse
 from app.models.ml_model import ml_model
 from app.database import init_db
+from app.repositories.prediction_repository import write_buffer
 from app.routers import prediction, admin
 
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route all application logging through an in-memory queue so handlers
+    never block the event loop on stdout I/O; a listener thread drains the
+    queue and writes the records.
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener.start()
+    return listener
+
+
+log_listener = setup_logging()
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.version,
-    description="ML-powered student dropout risk prediction with personalized support recommendations"
+    description="ML-powered student dropout risk prediction with personalized support recommendations",
+    default_response_class=ORJSONResponse  # orjson encodes responses several times faster than stdlib json
 )
 
 # Configure CORS
@@ -47,13 +77,26 @@ async def startup_event():
         "models/Model_Gradient_Boosting.pkl",
         "models/scaler.pkl",
     ]
-    try:
-        ml_model.archive_legacy_files(legacy_paths)
-    except Exception as e:
-        print(f"Archiving legacy models failed: {e}")
 
-    # Try to load the active model (will use fallback if not available)
-    ml_model.load_model(settings.model_path, settings.scaler_path)
+    def archive_and_load_model():
+        try:
+            ml_model.archive_legacy_files(legacy_paths)
+        except Exception as e:
+            print(f"Archiving legacy models failed: {e}")
+
+        # Try to load the active model (will use fallback if not available)
+        ml_model.load_model(settings.model_path, settings.scaler_path)
+
+    # Run the joblib load off the event loop and without blocking startup;
+    # /health reports ml_model_loaded=False until it completes
+    asyncio.get_running_loop().run_in_executor(None, archive_and_load_model)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Drain buffered prediction writes and queued log records on shutdown"""
+    await write_buffer.close()
+    log_listener.stop()
+
 
 @app.get("/")
 async def root():
@@ -74,5 +117,11 @@ async def health_check():
     )
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()  # faster asyncio event loop where available
+    except ImportError:
+        pass
+
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
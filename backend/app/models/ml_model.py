@@ -1,5 +1,7 @@
 # backend/app/models/ml_model.py
+import asyncio
 import joblib
+import logging
 import os
 import shutil
 from typing import Optional, List, Union
@@ -7,12 +9,17 @@ import numpy as np
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class MLModel:
     def __init__(self):
         self.model = None
         self.scaler = None
         self.is_loaded = False
+        # Bumped on every successful load so prediction caches keyed on it
+        # invalidate automatically when the model is swapped
+        self.generation = 0
 
     def archive_legacy_files(self, legacy_paths: List[str]):
         """Move legacy model/scaler files to the archived_models_dir and rename them with DEPRECATED tag."""
@@ -49,6 +56,7 @@ class MLModel:
 
                 self.scaler = joblib.load(scaler_path)
                 self.is_loaded = True
+                self.generation += 1
                 print(f"Model loaded successfully from {model_path}")
                 return True
             else:
@@ -62,11 +70,52 @@ class MLModel:
 
     def _prepare_features(self, features: Union[List[float], np.ndarray]) -> np.ndarray:
         """Ensure features are a 2D NumPy array in the shape (1, n_features)."""
-        arr = np.array(features)
+        arr = np.asarray(features)  # no copy when already an ndarray
         if arr.ndim == 1:
             arr = arr.reshape(1, -1)
         return arr
 
+    def _positive_class_index(self, n_cols: int) -> int:
+        """Determine the probability column for the Dropout class."""
+        # Assuming class 1 is Dropout
+        if hasattr(self.model, 'classes_'):
+            classes = list(self.model.classes_)
+            if 1 in classes:
+                return classes.index(1)
+            if 'Dropout' in classes:
+                return classes.index('Dropout')
+        # Fallback: assume second column is positive class
+        return 1 if n_cols > 1 else 0
+
+    def predict_batch(self, matrix: np.ndarray) -> List[Optional[dict]]:
+        """Score a whole (batch, n_features) matrix with one model call.
+
+        Returns one result dict (or None on failure) per input row.
+        """
+        if not self.is_loaded:
+            return [None] * len(matrix)
+
+        try:
+            X_scaled = self.scaler.transform(matrix)
+            probs = self.model.predict_proba(X_scaled)
+            predicted = self.model.predict(X_scaled)
+            pos_idx = self._positive_class_index(probs.shape[1])
+
+            results = []
+            for row_probs, predicted_index in zip(probs, predicted):
+                results.append({
+                    'dropout_probability': float(row_probs[pos_idx]),
+                    # Explicitly map prediction to Dropout/Non-Dropout
+                    'predicted_class': "Dropout" if int(predicted_index) == 1 else "Non-Dropout",
+                    'model_confidence': float(max(row_probs))
+                })
+            return results
+        except Exception:
+            # Queue-backed logging keeps a failing-batch storm off the
+            # stdout lock
+            logger.exception("Prediction error")
+            return [None] * len(matrix)
+
     def predict(self, features: Union[List[float], np.ndarray]) -> Optional[dict]:
         """Make prediction using the loaded model.
 
@@ -74,40 +123,61 @@ class MLModel:
         """
         if not self.is_loaded:
             return None
+        return self.predict_batch(self._prepare_features(features))[0]
 
-        try:
-            X = self._prepare_features(features)
-            X_scaled = self.scaler.transform(X)
-            probs = self.model.predict_proba(X_scaled)[0]
-            # Assuming class 1 is Dropout
-            # Determine index of positive class (1) if classes_ not ordered
-            if hasattr(self.model, 'classes_'):
-                classes = list(self.model.classes_)
-                if 1 in classes:
-                    pos_idx = classes.index(1)
-                elif 'Dropout' in classes:
-                    pos_idx = classes.index('Dropout')
-                else:
-                    # Fallback: assume second column is positive class
-                    pos_idx = 1 if len(probs) > 1 else 0
-            else:
-                pos_idx = 1 if len(probs) > 1 else 0
-
-            dropout_probability = float(probs[pos_idx])
-            predicted_index = int(self.model.predict(X_scaled)[0])
-            # Explicitly map prediction to Dropout/Non-Dropout
-            predicted_class = "Dropout" if predicted_index == 1 else "Non-Dropout"
-            model_confidence = float(max(probs))
-
-            return {
-                'dropout_probability': dropout_probability,
-                'predicted_class': predicted_class,
-                'model_confidence': model_confidence
-            }
-        except Exception as e:
-            print(f"Prediction error: {e}")
-            return None
+
+class BatchPredictor:
+    """
+    Micro-batches concurrent predict calls into single model invocations.
+
+    Requests are queued; a worker task drains up to `max_batch` of them,
+    waiting at most `max_wait` seconds for stragglers, stacks the feature
+    vectors into one matrix, and fans the per-row results back out through
+    futures. Under concurrent load this amortizes the per-call sklearn
+    overhead across the whole batch; a lone request just pays `max_wait`.
+    """
+
+    def __init__(self, model: MLModel, max_batch: int = 32, max_wait: float = 0.005):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, features: Union[List[float], np.ndarray]) -> Optional[dict]:
+        """Queue one feature vector and await its prediction result."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            # Started lazily so the queue binds to the running event loop
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        self._queue.put_nowait((features, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            matrix = np.vstack([np.asarray(features) for features, _ in batch])
+            results = self.model.predict_batch(matrix)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
 
 
 # Global model instance
 ml_model = MLModel()
+
+# Global micro-batching front end for the prediction endpoints
+batch_predictor = BatchPredictor(ml_model)
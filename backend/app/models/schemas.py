@@ -1,6 +1,6 @@
 # backend/app/models/schemas.py
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional
 
 class SimplifiedAssessmentRequest(BaseModel):
     # Consent
@@ -26,9 +26,9 @@ class SimplifiedAssessmentRequest(BaseModel):
     career_alignment: int
     
     # Services
-    services_used: list = []
+    services_used: List[str] = Field(default_factory=list)
     withdrawal_considered: bool
-    withdrawal_reasons: list = []
+    withdrawal_reasons: List[str] = Field(default_factory=list)
 
 
 class RawFeaturesRequest(BaseModel):
@@ -39,15 +39,20 @@ class RawFeaturesRequest(BaseModel):
                 "features": {"Curricular units 2nd sem (approved)": 3, "Curricular units 1st sem (approved)": 4, ...}
             }
         """
-        features: dict
+        features: Dict[str, float]
 
 class RiskFactor(BaseModel):
+    # Frozen: instances are shared module-level singletons on the hot path
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     category: str
     factor: str
     impact: str
     description: str
 
 class Recommendation(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     type: str
     title: str
     description: str
@@ -55,6 +60,8 @@ class Recommendation(BaseModel):
     contact: Optional[str] = None
 
 class PredictionResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     risk_level: str
     risk_score: int
     dropout_probability: float
@@ -74,6 +81,8 @@ class HealthResponse(BaseModel):
 # ============================================================================
 
 class DashboardStatsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     total_assessments: int
     high_risk_count: int
     medium_risk_count: int
@@ -85,6 +94,8 @@ class DashboardStatsResponse(BaseModel):
 
 
 class TrendDataPoint(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     week: str
     high_risk: int
     medium_risk: int
@@ -92,20 +103,28 @@ class TrendDataPoint(BaseModel):
 
 
 class TrendsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     data: List[TrendDataPoint]
 
 
 class RiskFactorSummary(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str
     percentage: float
     trend: str  # 'up', 'down', 'stable'
 
 
 class RiskFactorsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     factors: List[RiskFactorSummary]
 
 
 class AssessmentSummary(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     id: int
     name: str
     date: str
@@ -115,10 +134,24 @@ class AssessmentSummary(BaseModel):
 
 
 class RecentAssessmentsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     assessments: List[AssessmentSummary]
 
 
 class RiskDistributionResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     high: int
     medium: int
     low: int
+
+
+class DashboardAllResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    stats: DashboardStatsResponse
+    trends: TrendsResponse
+    risk_factors: RiskFactorsResponse
+    recent_assessments: RecentAssessmentsResponse
+    risk_distribution: RiskDistributionResponse
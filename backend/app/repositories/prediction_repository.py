@@ -1,12 +1,150 @@
 # backend/app/repositories/prediction_repository.py
+import asyncio
+import logging
+from collections import deque
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, case, and_
-from app.database import Prediction, AssessmentInput, RiskFactor, Recommendation
+from sqlalchemy import select, insert, func, case, and_, Integer, lambda_stmt
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.database import (
+    SessionLocal,
+    Prediction, AssessmentInput, RiskFactor, Recommendation, DailyRiskRollup,
+    SERVICE_BITS, WITHDRAWAL_REASON_BITS, pack_bitmask
+)
 from app.models.schemas import PredictionResponse, SimplifiedAssessmentRequest
+from app.utils.ttl_cache import ttl_cache, bump_stats_version
 from datetime import datetime, timedelta
-import json
 from typing import Optional, List, Dict
 
+logger = logging.getLogger(__name__)
+
+
+# Lambda statements for the hot dashboard queries: the SQL string and
+# parameter-binding plan are compiled once and reused across requests
+# instead of rebuilding the expression tree every call.
+STMT_STATS = lambda_stmt(lambda: select(
+    DailyRiskRollup.risk_level,
+    func.sum(DailyRiskRollup.count).label('count'),
+    func.sum(DailyRiskRollup.sum_score).label('sum_score')
+).group_by(DailyRiskRollup.risk_level))
+
+STMT_DIST = lambda_stmt(lambda: select(
+    DailyRiskRollup.risk_level,
+    func.sum(DailyRiskRollup.count).label('count')
+).group_by(DailyRiskRollup.risk_level))
+
+STMT_RECENT_BASE = lambda_stmt(lambda: select(
+    Prediction.id,
+    Prediction.created_at,
+    Prediction.risk_level,
+    AssessmentInput.academic_year
+).outerjoin(
+    AssessmentInput, Prediction.id == AssessmentInput.prediction_id
+).order_by(
+    Prediction.created_at.desc()
+))
+
+
+async def _insert_prediction(
+    db: AsyncSession,
+    prediction: PredictionResponse,
+    assessment_input: Optional[SimplifiedAssessmentRequest],
+    endpoint: str
+) -> int:
+    """
+    Issue the inserts for one prediction on an open session without
+    committing, so callers can batch several predictions per transaction.
+    Returns the prediction ID.
+    """
+    # 1. Insert prediction via Core, echoing back the new id without a
+    # separate flush round trip
+    result = await db.execute(
+        insert(Prediction).returning(Prediction.id),
+        {
+            "risk_level": prediction.risk_level,
+            "risk_score": prediction.risk_score,
+            "dropout_probability": prediction.dropout_probability,
+            "predicted_class": prediction.predicted_class if prediction.predicted_class else None,
+            "prediction_confidence": prediction.prediction_confidence,
+            "endpoint": endpoint
+        }
+    )
+    prediction_id = result.scalar_one()
+
+    # 2. Insert assessment inputs (if provided)
+    if assessment_input:
+        await db.execute(
+            insert(AssessmentInput),
+            {
+                "prediction_id": prediction_id,
+                "consent_given": assessment_input.consent_given,
+                "consent_data_processing": assessment_input.consent_data_processing,
+                "consent_anonymous_analytics": assessment_input.consent_anonymous_analytics,
+                "academic_year": assessment_input.academic_year,
+                "attendance": assessment_input.attendance,
+                "overwhelm_frequency": assessment_input.overwhelm_frequency,
+                "study_hours": assessment_input.study_hours,
+                "performance_satisfaction": assessment_input.performance_satisfaction,
+                "advisor_interaction": assessment_input.advisor_interaction,
+                "support_network_strength": assessment_input.support_network_strength,
+                "extracurricular_hours": assessment_input.extracurricular_hours,
+                "employment_status": assessment_input.employment_status,
+                "financial_stress": assessment_input.financial_stress,
+                "career_alignment": assessment_input.career_alignment,
+                "services_mask": pack_bitmask(assessment_input.services_used, SERVICE_BITS),
+                "withdrawal_considered": assessment_input.withdrawal_considered,
+                "withdrawal_mask": pack_bitmask(assessment_input.withdrawal_reasons, WITHDRAWAL_REASON_BITS)
+            }
+        )
+
+    # 3. Insert risk factors with a single executemany instead of one
+    # ORM add() per row
+    if prediction.risk_factors:
+        rf_rows = [
+            {
+                "prediction_id": prediction_id,
+                "category": rf.category,
+                "factor": rf.factor,
+                "impact": rf.impact,
+                "description": rf.description
+            }
+            for rf in prediction.risk_factors
+        ]
+        await db.execute(insert(RiskFactor), rf_rows)
+
+    # 4. Insert recommendations the same way
+    if prediction.recommendations:
+        rec_rows = [
+            {
+                "prediction_id": prediction_id,
+                "rec_type": rec.type,
+                "title": rec.title,
+                "description": rec.description,
+                "urgency": rec.urgency,
+                "contact": rec.contact if rec.contact else None
+            }
+            for rec in prediction.recommendations
+        ]
+        await db.execute(insert(Recommendation), rec_rows)
+
+    # 5. Maintain the daily rollup so dashboard reads stay O(days)
+    rollup_stmt = sqlite_insert(DailyRiskRollup).values(
+        date=datetime.utcnow().date(),
+        risk_level=prediction.risk_level,
+        count=1,
+        sum_score=prediction.risk_score
+    )
+    rollup_stmt = rollup_stmt.on_conflict_do_update(
+        index_elements=[DailyRiskRollup.date, DailyRiskRollup.risk_level],
+        set_={
+            "count": DailyRiskRollup.count + 1,
+            "sum_score": DailyRiskRollup.sum_score + prediction.risk_score
+        }
+    )
+    await db.execute(rollup_stmt)
+
+    return prediction_id
+
 
 async def save_prediction(
     db: AsyncSession,
@@ -19,133 +157,156 @@ async def save_prediction(
     Returns the prediction ID.
     """
     try:
-        # 1. Insert prediction
-        new_prediction = Prediction(
-            risk_level=prediction.risk_level,
-            risk_score=prediction.risk_score,
-            dropout_probability=prediction.dropout_probability,
-            predicted_class=prediction.predicted_class if prediction.predicted_class else None,
-            prediction_confidence=prediction.prediction_confidence,
-            endpoint=endpoint,
-            created_at=datetime.utcnow()
-        )
-        db.add(new_prediction)
-        await db.flush()  # Get the prediction ID
-
-        prediction_id = new_prediction.id
-
-        # 2. Insert assessment inputs (if provided)
-        if assessment_input:
-            new_assessment = AssessmentInput(
-                prediction_id=prediction_id,
-                consent_given=assessment_input.consent_given,
-                consent_data_processing=assessment_input.consent_data_processing,
-                consent_anonymous_analytics=assessment_input.consent_anonymous_analytics,
-                academic_year=assessment_input.academic_year,
-                attendance=assessment_input.attendance,
-                overwhelm_frequency=assessment_input.overwhelm_frequency,
-                study_hours=assessment_input.study_hours,
-                performance_satisfaction=assessment_input.performance_satisfaction,
-                advisor_interaction=assessment_input.advisor_interaction,
-                support_network_strength=assessment_input.support_network_strength,
-                extracurricular_hours=assessment_input.extracurricular_hours,
-                employment_status=assessment_input.employment_status,
-                financial_stress=assessment_input.financial_stress,
-                career_alignment=assessment_input.career_alignment,
-                services_used=json.dumps(assessment_input.services_used) if assessment_input.services_used else None,
-                withdrawal_considered=assessment_input.withdrawal_considered,
-                withdrawal_reasons=json.dumps(assessment_input.withdrawal_reasons) if assessment_input.withdrawal_reasons else None
-            )
-            db.add(new_assessment)
-
-        # 3. Insert risk factors
-        for risk_factor in prediction.risk_factors:
-            new_risk_factor = RiskFactor(
-                prediction_id=prediction_id,
-                category=risk_factor.category,
-                factor=risk_factor.factor,
-                impact=risk_factor.impact,
-                description=risk_factor.description
-            )
-            db.add(new_risk_factor)
-
-        # 4. Insert recommendations
-        for recommendation in prediction.recommendations:
-            new_recommendation = Recommendation(
-                prediction_id=prediction_id,
-                rec_type=recommendation.type,
-                title=recommendation.title,
-                description=recommendation.description,
-                urgency=recommendation.urgency,
-                contact=recommendation.contact if recommendation.contact else None
-            )
-            db.add(new_recommendation)
+        prediction_id = await _insert_prediction(db, prediction, assessment_input, endpoint)
 
         # Commit transaction
         await db.commit()
+
+        # New data invalidates the cached dashboard aggregates
+        bump_stats_version()
         return prediction_id
 
-    except Exception as e:
+    except Exception:
         await db.rollback()
-        print(f"Error saving prediction: {e}")
+        logger.exception("Error saving prediction")
         raise
 
 
+class PredictionWriteBuffer:
+    """
+    Write-behind buffer for prediction saves.
+
+    Endpoints enqueue results and return; a background task drains up to
+    `max_batch` entries every `flush_interval` seconds and writes them on
+    one session in one transaction, amortizing session setup and the
+    commit fsync across the whole batch.
+    """
+
+    def __init__(self, max_batch: int = 100, flush_interval: float = 0.05):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: deque = deque()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def enqueue(
+        self,
+        prediction: PredictionResponse,
+        assessment_input: Optional[SimplifiedAssessmentRequest],
+        endpoint: str
+    ):
+        """Queue one prediction for the next flush."""
+        async with self._lock:
+            self._pending.append((prediction, assessment_input, endpoint))
+        if self._task is None or self._task.done():
+            # Started lazily so the task binds to the running event loop
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def flush(self):
+        """Write up to max_batch pending entries in one transaction."""
+        async with self._lock:
+            batch = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+        if not batch:
+            return
+
+        try:
+            async with SessionLocal() as db:
+                try:
+                    for prediction, assessment_input, endpoint in batch:
+                        await _insert_prediction(db, prediction, assessment_input, endpoint)
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
+            bump_stats_version()
+        except Exception:
+            logger.exception("Error flushing %d buffered predictions", len(batch))
+
+    async def close(self):
+        """Stop the flush task and drain whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._pending:
+            await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+# Global write-behind buffer shared by the prediction endpoints
+write_buffer = PredictionWriteBuffer()
+
+
+@ttl_cache(seconds=5)
 async def get_dashboard_stats(db: AsyncSession) -> Dict:
     """
-    Calculate aggregated dashboard statistics.
+    Calculate aggregated dashboard statistics from the daily rollup,
+    which is O(days x risk levels) instead of a full predictions scan.
     """
-    query = select(
-        func.count(Prediction.id).label('total'),
-        func.sum(case((Prediction.risk_level == 'high', 1), else_=0)).label('high_count'),
-        func.sum(case((Prediction.risk_level == 'medium', 1), else_=0)).label('medium_count'),
-        func.sum(case((Prediction.risk_level == 'low', 1), else_=0)).label('low_count'),
-        func.avg(Prediction.risk_score).label('avg_score')
-    )
+    result = await db.execute(STMT_STATS)
+    rows = result.all()
 
-    result = await db.execute(query)
-    row = result.first()
+    counts = {'high': 0, 'medium': 0, 'low': 0}
+    total_score = 0
+    for row in rows:
+        counts[row.risk_level] = row.count or 0
+        total_score += row.sum_score or 0
 
-    total = row.total or 0
-    high = row.high_count or 0
-    medium = row.medium_count or 0
-    low = row.low_count or 0
+    total = counts['high'] + counts['medium'] + counts['low']
 
     return {
         'total_assessments': total,
-        'high_risk_count': high,
-        'medium_risk_count': medium,
-        'low_risk_count': low,
-        'high_risk_percentage': round((high / total * 100) if total > 0 else 0, 2),
-        'medium_risk_percentage': round((medium / total * 100) if total > 0 else 0, 2),
-        'low_risk_percentage': round((low / total * 100) if total > 0 else 0, 2),
-        'average_risk_score': round(row.avg_score or 0, 1)
+        'high_risk_count': counts['high'],
+        'medium_risk_count': counts['medium'],
+        'low_risk_count': counts['low'],
+        'high_risk_percentage': round((counts['high'] / total * 100) if total > 0 else 0, 2),
+        'medium_risk_percentage': round((counts['medium'] / total * 100) if total > 0 else 0, 2),
+        'low_risk_percentage': round((counts['low'] / total * 100) if total > 0 else 0, 2),
+        'average_risk_score': round((total_score / total) if total > 0 else 0, 1)
     }
 
 
+@ttl_cache(seconds=5)
 async def get_risk_trends(db: AsyncSession, weeks: int = 8) -> List[Dict]:
     """
     Get risk counts grouped by week for trend chart.
+
+    Reads the daily rollup and groups it on an integer weeks-since-epoch
+    bucket instead of a per-row strftime('%Y-%W') call, so SQLite sums a
+    handful of daily rows with integer group keys.
     """
-    start_date = datetime.utcnow() - timedelta(weeks=weeks)
+    start_date = (datetime.utcnow() - timedelta(weeks=weeks)).date()
+
+    # julianday('1970-01-01') == 2440587.5, so this is unix days / 7
+    week_bucket = func.cast(
+        (func.julianday(DailyRiskRollup.date) - 2440587.5) / 7, Integer
+    ).label('week_bucket')
 
     query = select(
-        func.strftime('%Y-%W', Prediction.created_at).label('week_num'),
-        Prediction.risk_level,
-        func.count(Prediction.id).label('count')
+        week_bucket,
+        DailyRiskRollup.risk_level,
+        func.sum(DailyRiskRollup.count).label('count')
     ).where(
-        Prediction.created_at >= start_date
+        DailyRiskRollup.date >= start_date
     ).group_by(
-        'week_num', Prediction.risk_level
-    ).order_by('week_num')
+        'week_bucket', DailyRiskRollup.risk_level
+    ).order_by('week_bucket')
 
-    result = await db.execute(query)
-    rows = result.all()
+    result = await db.stream(query.execution_options(yield_per=500))
 
-    # Transform into chart format
+    # Transform into chart format, mapping buckets back to "Wxx" labels.
+    # Streaming keeps peak memory bounded as history grows.
     weekly_data = {}
-    for row in rows:
-        week_key = f"W{row.week_num.split('-')[1]}"  # Extract week number
+    async for row in result:
+        bucket_start = datetime.utcfromtimestamp(row.week_bucket * 604800)
+        week_key = f"W{bucket_start.strftime('%W')}"
         if week_key not in weekly_data:
             weekly_data[week_key] = {'week': week_key, 'high_risk': 0, 'medium_risk': 0, 'low_risk': 0}
 
@@ -159,22 +320,14 @@ async def get_risk_trends(db: AsyncSession, weeks: int = 8) -> List[Dict]:
     return list(weekly_data.values())
 
 
+@ttl_cache(seconds=5)
 async def get_recent_assessments(db: AsyncSession, limit: int = 10) -> List[Dict]:
     """
     Get most recent predictions with basic information.
     """
-    query = select(
-        Prediction.id,
-        Prediction.created_at,
-        Prediction.risk_level,
-        AssessmentInput.academic_year
-    ).outerjoin(
-        AssessmentInput, Prediction.id == AssessmentInput.prediction_id
-    ).order_by(
-        Prediction.created_at.desc()
-    ).limit(limit)
+    stmt = STMT_RECENT_BASE + (lambda s: s.limit(limit))
 
-    result = await db.execute(query)
+    result = await db.execute(stmt)
     rows = result.all()
 
     assessments = []
@@ -191,22 +344,37 @@ async def get_recent_assessments(db: AsyncSession, limit: int = 10) -> List[Dict
     return assessments
 
 
+@ttl_cache(seconds=5)
 async def get_top_risk_factors(db: AsyncSession, limit: int = 5) -> List[Dict]:
     """
     Get top risk factors by occurrence with trend calculation.
+
+    A single GROUP BY returns the total, current-week, and previous-week
+    counts per category, so trends no longer cost two extra queries each.
     """
-    # Count factors by category
+    now = datetime.utcnow()
+    week_ago = now - timedelta(days=7)
+    two_weeks_ago = now - timedelta(days=14)
+
     query = select(
         RiskFactor.category,
-        func.count(RiskFactor.id).label('count')
+        func.count(RiskFactor.id).label('count'),
+        func.sum(
+            case((Prediction.created_at >= week_ago, 1), else_=0)
+        ).label('current_count'),
+        func.sum(
+            case((and_(Prediction.created_at >= two_weeks_ago, Prediction.created_at < week_ago), 1), else_=0)
+        ).label('prev_count')
+    ).join(
+        Prediction, RiskFactor.prediction_id == Prediction.id
     ).group_by(
         RiskFactor.category
     ).order_by(
         func.count(RiskFactor.id).desc()
     ).limit(limit)
 
-    result = await db.execute(query)
-    rows = result.all()
+    result = await db.stream(query.execution_options(yield_per=500))
+    rows = [row async for row in result]
 
     total_factors = sum(r.count for r in rows)
 
@@ -214,8 +382,14 @@ async def get_top_risk_factors(db: AsyncSession, limit: int = 5) -> List[Dict]:
     for row in rows:
         percentage = (row.count / total_factors * 100) if total_factors > 0 else 0
 
-        # Calculate trend (compare current week vs previous week)
-        trend = await calculate_trend(db, row.category)
+        current_count = row.current_count or 0
+        prev_count = row.prev_count or 0
+        if current_count > prev_count:
+            trend = 'up'
+        elif current_count < prev_count:
+            trend = 'down'
+        else:
+            trend = 'stable'
 
         factors.append({
             'name': row.category,
@@ -226,63 +400,12 @@ async def get_top_risk_factors(db: AsyncSession, limit: int = 5) -> List[Dict]:
     return factors
 
 
-async def calculate_trend(db: AsyncSession, category: str) -> str:
-    """
-    Compare current week vs previous week count for a risk factor category.
-    """
-    now = datetime.utcnow()
-    week_ago = now - timedelta(days=7)
-    two_weeks_ago = now - timedelta(days=14)
-
-    # Count this week
-    query_current = select(func.count(RiskFactor.id)).where(
-        and_(
-            RiskFactor.category == category,
-            RiskFactor.id.in_(
-                select(RiskFactor.id).join(Prediction).where(Prediction.created_at >= week_ago)
-            )
-        )
-    )
-    current_result = await db.execute(query_current)
-    current_count = current_result.scalar() or 0
-
-    # Count previous week
-    query_prev = select(func.count(RiskFactor.id)).where(
-        and_(
-            RiskFactor.category == category,
-            RiskFactor.id.in_(
-                select(RiskFactor.id).join(Prediction).where(
-                    and_(
-                        Prediction.created_at >= two_weeks_ago,
-                        Prediction.created_at < week_ago
-                    )
-                )
-            )
-        )
-    )
-    prev_result = await db.execute(query_prev)
-    prev_count = prev_result.scalar() or 0
-
-    if current_count > prev_count:
-        return 'up'
-    elif current_count < prev_count:
-        return 'down'
-    else:
-        return 'stable'
-
-
+@ttl_cache(seconds=5)
 async def get_risk_distribution(db: AsyncSession) -> Dict:
     """
-    Get simple count by risk level.
+    Get simple count by risk level from the daily rollup.
     """
-    query = select(
-        Prediction.risk_level,
-        func.count(Prediction.id).label('count')
-    ).group_by(
-        Prediction.risk_level
-    )
-
-    result = await db.execute(query)
+    result = await db.execute(STMT_DIST)
     rows = result.all()
 
     distribution = {'high': 0, 'medium': 0, 'low': 0}
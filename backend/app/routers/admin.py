@@ -1,7 +1,9 @@
 # backend/app/routers/admin.py
+import asyncio
+import logging
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.repositories.prediction_repository import (
     get_dashboard_stats,
     get_risk_trends,
@@ -15,9 +17,12 @@ from app.models.schemas import (
     TrendDataPoint,
     RiskFactorsResponse,
     RecentAssessmentsResponse,
-    RiskDistributionResponse
+    RiskDistributionResponse,
+    DashboardAllResponse
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
@@ -35,8 +40,8 @@ async def dashboard_stats(db: AsyncSession = Depends(get_db)):
     try:
         stats = await get_dashboard_stats(db)
         return DashboardStatsResponse(**stats)
-    except Exception as e:
-        print(f"Error fetching dashboard stats: {e}")
+    except Exception:
+        logger.exception("Error fetching dashboard stats")
         # Return empty stats on error
         return DashboardStatsResponse(
             total_assessments=0,
@@ -65,8 +70,8 @@ async def dashboard_trends(period: str = 'weekly', db: AsyncSession = Depends(ge
         trends_data = await get_risk_trends(db, weeks=8)
         trend_points = [TrendDataPoint(**item) for item in trends_data]
         return TrendsResponse(data=trend_points)
-    except Exception as e:
-        print(f"Error fetching trends: {e}")
+    except Exception:
+        logger.exception("Error fetching trends")
         # Return empty trends on error
         return TrendsResponse(data=[])
 
@@ -85,8 +90,8 @@ async def top_risk_factors(limit: int = 5, db: AsyncSession = Depends(get_db)):
     try:
         factors = await get_top_risk_factors(db, limit=limit)
         return RiskFactorsResponse(factors=factors)
-    except Exception as e:
-        print(f"Error fetching risk factors: {e}")
+    except Exception:
+        logger.exception("Error fetching risk factors")
         # Return empty factors on error
         return RiskFactorsResponse(factors=[])
 
@@ -105,12 +110,65 @@ async def recent_assessments(limit: int = 10, db: AsyncSession = Depends(get_db)
     try:
         assessments = await get_recent_assessments(db, limit=limit)
         return RecentAssessmentsResponse(assessments=assessments)
-    except Exception as e:
-        print(f"Error fetching recent assessments: {e}")
+    except Exception:
+        logger.exception("Error fetching recent assessments")
         # Return empty assessments on error
         return RecentAssessmentsResponse(assessments=[])
 
 
+@router.get("/dashboard/all", response_model=DashboardAllResponse)
+async def dashboard_all():
+    """
+    Get all dashboard data in a single request.
+
+    Runs the stats, trends, risk-factor, recent-assessment, and distribution
+    queries concurrently on separate pooled sessions, so the dashboard pays
+    the cost of the slowest query instead of the sum of all five.
+
+    Returns:
+        DashboardAllResponse combining every individual dashboard payload
+    """
+    async def run_query(fn, *args):
+        # Each query gets its own session so WAL-mode readers can overlap
+        async with SessionLocal() as session:
+            return await fn(session, *args)
+
+    try:
+        stats, trends_data, factors, assessments, distribution = await asyncio.gather(
+            run_query(get_dashboard_stats),
+            run_query(get_risk_trends, 8),
+            run_query(get_top_risk_factors, 5),
+            run_query(get_recent_assessments, 10),
+            run_query(get_risk_distribution)
+        )
+        return DashboardAllResponse(
+            stats=DashboardStatsResponse(**stats),
+            trends=TrendsResponse(data=[TrendDataPoint(**item) for item in trends_data]),
+            risk_factors=RiskFactorsResponse(factors=factors),
+            recent_assessments=RecentAssessmentsResponse(assessments=assessments),
+            risk_distribution=RiskDistributionResponse(**distribution)
+        )
+    except Exception:
+        logger.exception("Error fetching combined dashboard data")
+        # Return empty payloads on error
+        return DashboardAllResponse(
+            stats=DashboardStatsResponse(
+                total_assessments=0,
+                high_risk_count=0,
+                medium_risk_count=0,
+                low_risk_count=0,
+                high_risk_percentage=0.0,
+                medium_risk_percentage=0.0,
+                low_risk_percentage=0.0,
+                average_risk_score=0.0
+            ),
+            trends=TrendsResponse(data=[]),
+            risk_factors=RiskFactorsResponse(factors=[]),
+            recent_assessments=RecentAssessmentsResponse(assessments=[]),
+            risk_distribution=RiskDistributionResponse(high=0, medium=0, low=0)
+        )
+
+
 @router.get("/risk-distribution", response_model=RiskDistributionResponse)
 async def risk_distribution(db: AsyncSession = Depends(get_db)):
     """
@@ -122,7 +180,7 @@ async def risk_distribution(db: AsyncSession = Depends(get_db)):
     try:
         distribution = await get_risk_distribution(db)
         return RiskDistributionResponse(**distribution)
-    except Exception as e:
-        print(f"Error fetching risk distribution: {e}")
+    except Exception:
+        logger.exception("Error fetching risk distribution")
         # Return zero distribution on error
         return RiskDistributionResponse(high=0, medium=0, low=0)
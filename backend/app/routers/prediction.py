@@ -1,11 +1,15 @@
 # backend/app/routers/prediction.py
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+import bisect
+import operator
+from functools import lru_cache
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from app.models.schemas import SimplifiedAssessmentRequest, PredictionResponse, RiskFactor, Recommendation, RawFeaturesRequest
-from app.models.ml_model import ml_model
-from app.database import get_db
-from app.repositories.prediction_repository import save_prediction
-from typing import List
+from app.models.ml_model import ml_model, batch_predictor
+from app.repositories.prediction_repository import write_buffer
+from typing import List, Optional
 
 # NOTE: FEATURE_ORDER must match the order used during model training.
 # Keep this list in sync with backend/ml/train_model.py: FEATURE_COLUMNS
@@ -20,71 +24,322 @@ FEATURE_ORDER: List[str] = [
     'Application mode'
 ]
 
+# Precomputed extractor: pulls all eight features from a request dict in
+# one C-level call instead of a Python loop of keyed lookups
+FEATURE_GETTER = operator.itemgetter(*FEATURE_ORDER)
+FEATURE_SET = frozenset(FEATURE_ORDER)
+
 router = APIRouter(prefix="/predict", tags=["prediction"])
 
-def map_form_to_ml_features(data: SimplifiedAssessmentRequest) -> List[float]:
+# ============================================================================
+# Feature-mapping lookup tables
+# ============================================================================
+# Hoisted to module scope so map_form_to_ml_features does plain lookups
+# instead of rebuilding these dicts on every request.
+
+# Attendance maps to curricular units approved (study performance proxy)
+ATTENDANCE_TO_UNITS = {
+    'always': 50, 'often': 45, 'sometimes': 30, 'rarely': 15, 'never': 5
+}
+
+# Financial stress -> 1 when fees are likely up to date / scholarship likely
+# held (the tuition and scholarship tables were identical, so they share this)
+FINANCIAL_POS_MAP = {'none': 1, 'low': 1, 'moderate': 0, 'high': 0, 'very-high': 0}
+
+# Age proxy based on academic year
+ACADEMIC_YEAR_AGE = {'1st': 18, '2nd': 19, '3rd': 20, '4th': 21}
+
+# Age adjustment based on employment
+EMPLOYMENT_AGE_ADJUSTMENT = {'not-employed': 0, 'part-time': 1, 'full-time': 2}
+
+# Debtor status based on financial stress
+DEBTOR_MAP = {'none': 0, 'low': 0, 'moderate': 1, 'high': 1, 'very-high': 1}
+
+# Gender proxy from study hours (1 male, 0 female); unknown buckets -> 1
+GENDER_LUT = {'8+': 0, '5-8': 0}
+
+# Application mode from (employment status, poor career alignment):
+# only full-time workers with alignment < 5 count as alternative entry
+APPMODE_LUT = {('full-time', True): 2}
+
+# Answer buckets used by the factor/recommendation rules below. frozensets
+# give O(1) hashed membership tests instead of scanning list literals.
+LOW_ATT = frozenset({'rarely', 'never'})
+HIGH_OVW = frozenset({'often', 'always'})
+HIGH_FIN = frozenset({'high', 'very-high'})
+SPARSE_ADV = frozenset({'never', 'once-semester'})
+
+# Dropout-probability cut points for the low/medium/high buckets.
+# bisect_right against the sorted tuple replaces the chained if/elif and
+# keeps the boundary semantics (>= 0.35 medium, >= 0.6 high).
+THRESHOLDS = (0.35, 0.6)
+LEVELS = ('low', 'medium', 'high')
+
+# Level per integer risk score (0-100), derived from THRESHOLDS once at
+# import. Only the fallback path classifies by table, where the integer
+# score is the source value; the ML paths bucket the raw probability so
+# rounding to a score can't shift results across a threshold.
+_LEVEL_TABLE = tuple(
+    LEVELS[bisect.bisect_right(THRESHOLDS, score / 100)] for score in range(101)
+)
+
+
+def risk_level_for(dropout_probability: float) -> str:
+    """Bucket a dropout probability into 'low', 'medium' or 'high'."""
+    return LEVELS[bisect.bisect_right(THRESHOLDS, dropout_probability)]
+
+
+# ============================================================================
+# Static risk factors and recommendations
+# ============================================================================
+# Built once at import so handlers append shared references instead of
+# re-validating identical Pydantic literals on every request.
+
+STATIC_RISK_FACTORS = {
+    'low_attendance': RiskFactor(
+        category="Academic",
+        factor="Low Class Attendance",
+        impact="high",
+        description="Inconsistent class attendance is strongly correlated with dropout risk"
+    ),
+    'overwhelm': RiskFactor(
+        category="Mental Health",
+        factor="Academic Overwhelm",
+        impact="high",
+        description="Feeling frequently overwhelmed can lead to burnout and withdrawal"
+    ),
+    'financial_stress': RiskFactor(
+        category="Financial",
+        factor="Financial Stress",
+        impact="high",
+        description="Financial difficulties are a leading cause of student withdrawal"
+    ),
+    'withdrawal_considered': RiskFactor(
+        category="Behavioral",
+        factor="Withdrawal Consideration",
+        impact="high",
+        description="Active consideration of withdrawal indicates elevated risk"
+    ),
+    'weak_support': RiskFactor(
+        category="Social",
+        factor="Weak Support Network",
+        impact="medium",
+        description="Limited social support increases vulnerability during challenges"
+    ),
+    'full_time_work': RiskFactor(
+        category="Personal",
+        factor="Full-time Employment",
+        impact="medium",
+        description="Working full-time while studying significantly increases time pressure"
+    ),
+}
+
+STATIC_RECS = {
+    'counseling': Recommendation(
+        type="counseling",
+        title="Mental Health Support",
+        description="Schedule an urgent appointment with a counselor to discuss your concerns and develop a support plan",
+        urgency="immediate",
+        contact="counseling@rvce.edu.in"
+    ),
+    'financial_aid': Recommendation(
+        type="financial",
+        title="Financial Aid Office",
+        description="Connect with financial aid office to explore scholarships, grants, and emergency funding options",
+        urgency="soon",
+        contact="financialaid@rvce.edu.in"
+    ),
+    'tutoring': Recommendation(
+        type="academic",
+        title="Academic Tutoring",
+        description="Access tutoring services and study groups to improve academic performance",
+        urgency="soon",
+        contact="tutoring@rvce.edu.in"
+    ),
+    'advisor': Recommendation(
+        type="academic",
+        title="Schedule Advisor Meeting",
+        description="Regular meetings with your academic advisor can help with course planning and early problem detection",
+        urgency="soon",
+        contact="advising@rvce.edu.in"
+    ),
+    'time_management': Recommendation(
+        type="peer",
+        title="Time Management Support",
+        description="Consider reducing work hours or exploring flexible work arrangements to prioritize your studies",
+        urgency="soon"
+    ),
+    'explore_services': Recommendation(
+        type="support",
+        title="Explore Campus Support Services",
+        description="You haven't indicated using any support services yet. Visit the student center to learn about available resources including academic advising, counseling, and health services.",
+        urgency="soon",
+        contact="studentcenter@rvce.edu.in"
+    ),
+    'stay_connected': Recommendation(
+        type="peer",
+        title="Stay Connected",
+        description="Continue engaging with campus resources and maintain your support network",
+        urgency="when-needed"
+    ),
+}
+
+# Withdrawal-reason handling as parallel tuples: one int lookup in
+# WR_INDEX, then two tuple indexes, instead of nested string-keyed dicts.
+# The objects themselves are shared module-level singletons.
+WR_INDEX = {
+    'Academic difficulty': 0,
+    'Financial challenges': 1,
+    'Mental health': 2,
+    'Personal/family issues': 3,
+    'Lack of interest': 4,
+    'Career opportunities': 5,
+}
+
+WR_RECS = (
+    Recommendation(
+        type="academic",
+        title="Academic Support Program",
+        description="Enroll in our comprehensive academic support program with tutoring, study groups, and study skills workshops",
+        urgency="immediate",
+        contact="academicsupport@rvce.edu.in"
+    ),
+    Recommendation(
+        type="financial",
+        title="Emergency Financial Assistance",
+        description="Apply for emergency grants or loans. Meet with financial counselor to create a sustainable plan",
+        urgency="immediate",
+        contact="financialaid@rvce.edu.in"
+    ),
+    Recommendation(
+        type="counseling",
+        title="Mental Health Crisis Support",
+        description="Contact counseling center immediately. We also have peer support groups and crisis resources available",
+        urgency="immediate",
+        contact="counseling@rvce.edu.in"
+    ),
+    Recommendation(
+        type="support",
+        title="Personal Counseling & Family Support",
+        description="Our counselors can help you navigate personal and family challenges while maintaining your academic progress",
+        urgency="soon",
+        contact="counseling@rvce.edu.in"
+    ),
+    Recommendation(
+        type="academic",
+        title="Academic Advising & Program Exploration",
+        description="Meet with academic advisor to explore program alternatives, course selections, or potential major changes",
+        urgency="soon",
+        contact="advising@rvce.edu.in"
+    ),
+    Recommendation(
+        type="career",
+        title="Career Planning & Education Strategy",
+        description="Explore how to balance career opportunities with completing your degree. Many students pursue internships while studying",
+        urgency="soon",
+        contact="career@rvce.edu.in"
+    ),
+)
+
+WR_FACTORS = (
+    RiskFactor(
+        category="Academic",
+        factor="Academic Difficulty",
+        impact="high",
+        description="Struggling with academic material can lead to course failure and withdrawal"
+    ),
+    RiskFactor(
+        category="Financial",
+        factor="Financial Crisis",
+        impact="high",
+        description="Severe financial issues are a primary driver of student withdrawal"
+    ),
+    RiskFactor(
+        category="Mental Health",
+        factor="Mental Health Crisis",
+        impact="high",
+        description="Mental health challenges require immediate professional support and intervention"
+    ),
+    RiskFactor(
+        category="Personal",
+        factor="Personal/Family Crisis",
+        impact="high",
+        description="Personal and family issues can significantly impact academic focus and commitment"
+    ),
+    RiskFactor(
+        category="Academic",
+        factor="Loss of Academic Interest",
+        impact="high",
+        description="Declining interest in studies suggests misalignment with chosen program or career path"
+    ),
+    RiskFactor(
+        category="Career",
+        factor="Career Path Conflict",
+        impact="medium",
+        description="External career opportunities may be pulling focus away from academic commitments"
+    ),
+)
+
+
+# Pre-encoded body for the most common payload: a low-risk fallback
+# result with no triggered factors and only the stay-connected
+# recommendation. Everything except the two numbers is static, so the
+# handler splices them into the template and skips Pydantic + FastAPI
+# response encoding entirely.
+_STAY_CONNECTED_ONLY = [STATIC_RECS['stay_connected']]
+_LOW_RISK_TEMPLATE = (
+    '{"risk_level":"low","risk_score":%d,"dropout_probability":%.4f,'
+    '"predicted_class":null,"risk_factors":[],'
+    '"recommendations":' + orjson.dumps([STATIC_RECS['stay_connected'].model_dump()]).decode() +
+    ',"prediction_confidence":0.75}'
+)
+
+
+async def _schedule_save(
+    prediction: PredictionResponse,
+    assessment_input: Optional[SimplifiedAssessmentRequest],
+    endpoint: str
+):
+    """Hand the prediction to the write-behind buffer; the flush task
+    persists it off the response path."""
+    await write_buffer.enqueue(prediction, assessment_input, endpoint)
+
+def map_form_to_ml_features(data: SimplifiedAssessmentRequest) -> np.ndarray:
     """
     Map all form inputs to ML model's required features.
     ML Model expects: ['Curricular units 2nd sem (approved)', 'Curricular units 1st sem (approved)',
                        'Tuition fees up to date', 'Scholarship holder', 'Age at enrollment',
                        'Debtor', 'Gender', 'Application mode']
+
+    Fills the feature vector in place and returns it as an ndarray, so the
+    model sees an array directly instead of converting a Python list.
     """
-    # Attendance maps to curricular units approved (study performance proxy)
-    attendance_to_units = {
-        'always': 50, 'often': 45, 'sometimes': 30, 'rarely': 15, 'never': 5
-    }
-    curricular_2nd_sem = attendance_to_units.get(data.attendance, 30)
-    curricular_1st_sem = attendance_to_units.get(data.attendance, 30)
-    
-    # Performance satisfaction affects study units
-    performance_factor = (data.performance_satisfaction / 10.0)
-    curricular_2nd_sem = int(curricular_2nd_sem * performance_factor)
-    curricular_1st_sem = int(curricular_1st_sem * performance_factor)
-    
-    # Tuition fees based on financial stress
-    financial_stress_map = {'none': 1, 'low': 1, 'moderate': 0, 'high': 0, 'very-high': 0}
-    tuition_fees_up_to_date = float(financial_stress_map.get(data.financial_stress, 0))
-    
-    # Scholarship holder based on financial stress
-    scholarship_scores = {'none': 1, 'low': 1, 'moderate': 0, 'high': 0, 'very-high': 0}
-    scholarship_holder = float(scholarship_scores.get(data.financial_stress, 0))
-    
-    # Age proxy based on academic year
-    academic_year_map = {'1st': 18, '2nd': 19, '3rd': 20, '4th': 21}
-    age_base = academic_year_map.get(data.academic_year, 19)
-    
-    # Adjust age based on employment
-    employment_age_adjustment = {'not-employed': 0, 'part-time': 1, 'full-time': 2}
-    age_at_enrollment = float(age_base + employment_age_adjustment.get(data.employment_status, 0))
-    
-    # Debtor status based on financial stress
-    debtor_map = {'none': 0, 'low': 0, 'moderate': 1, 'high': 1, 'very-high': 1}
-    debtor = float(debtor_map.get(data.financial_stress, 0))
-    
+    vec = np.empty(8, dtype=np.float64)
+
+    # Performance satisfaction scales the attendance-derived study units.
+    # Pure integer math: (units * satisfaction) // 10 matches the old
+    # int(units * satisfaction / 10.0) truncation without the float trip.
+    approved_units = (ATTENDANCE_TO_UNITS.get(data.attendance, 30) * data.performance_satisfaction) // 10
+    vec[0] = approved_units  # Curricular units 2nd sem
+    vec[1] = approved_units  # Curricular units 1st sem
+
+    # Tuition fees and scholarship both follow financial stress
+    fees_and_scholarship = FINANCIAL_POS_MAP.get(data.financial_stress, 0)
+    vec[2] = fees_and_scholarship
+    vec[3] = fees_and_scholarship
+
+    age_base = ACADEMIC_YEAR_AGE.get(data.academic_year, 19)
+    vec[4] = age_base + EMPLOYMENT_AGE_ADJUSTMENT.get(data.employment_status, 0)
+
+    vec[5] = DEBTOR_MAP.get(data.financial_stress, 0)
+
     # Gender (1 for male, 0 for female) - use study hours as proxy
-    if data.study_hours in ['8+', '5-8']:
-        gender = 0  # Female tend to study more
-    else:
-        gender = 1
-    
-    # Application mode based on employment and career alignment
-    if data.employment_status == 'full-time' and data.career_alignment < 5:
-        application_mode = 2  # Alternative entry
-    elif data.career_alignment >= 8:
-        application_mode = 1  # Regular entry
-    else:
-        application_mode = 1
-    
-    return [
-        curricular_2nd_sem,
-        curricular_1st_sem,
-        tuition_fees_up_to_date,
-        scholarship_holder,
-        age_at_enrollment,
-        debtor,
-        gender,
-        application_mode
-    ]
+    vec[6] = GENDER_LUT.get(data.study_hours, 1)  # Female tend to study more
+
+    # Application mode: 2 = alternative entry, 1 = regular entry
+    vec[7] = APPMODE_LUT.get((data.employment_status, data.career_alignment < 5), 1)
+
+    return vec
 
 def filter_risk_factors_by_level(risk_factors: List[RiskFactor], risk_level: str) -> List[RiskFactor]:
     """
@@ -104,7 +359,8 @@ def filter_risk_factors_by_level(risk_factors: List[RiskFactor], risk_level: str
             else:
                 adjusted_impact = 'low'
 
-            adjusted_factors.append(RiskFactor(
+            # model_construct: fields come from an already-validated factor
+            adjusted_factors.append(RiskFactor.model_construct(
                 category=factor.category,
                 factor=factor.factor,
                 impact=adjusted_impact,
@@ -122,7 +378,7 @@ def filter_risk_factors_by_level(risk_factors: List[RiskFactor], risk_level: str
             else:
                 adjusted_impact = 'medium'
 
-            adjusted_factors.append(RiskFactor(
+            adjusted_factors.append(RiskFactor.model_construct(
                 category=factor.category,
                 factor=factor.factor,
                 impact=adjusted_impact,
@@ -135,153 +391,143 @@ def filter_risk_factors_by_level(risk_factors: List[RiskFactor], risk_level: str
         return risk_factors
 
 
-def calculate_fallback_risk(data: SimplifiedAssessmentRequest) -> PredictionResponse:
-    """Fallback prediction when ML model is not available"""
-    risk_score = 0
-
-    # Attendance scoring
-    attendance_scores = {
-        'always': 0, 'often': 5, 'sometimes': 15, 'rarely': 25, 'never': 35
-    }
-    risk_score += attendance_scores.get(data.attendance, 0)
-
-    # Overwhelm scoring
-    overwhelm_scores = {
-        'never': 0, 'rarely': 5, 'sometimes': 10, 'often': 20, 'always': 30
-    }
-    risk_score += overwhelm_scores.get(data.overwhelm_frequency, 0)
-
-    # Financial stress scoring
-    financial_scores = {
-        'none': 0, 'low': 5, 'moderate': 10, 'high': 20, 'very-high': 25
-    }
-    risk_score += financial_scores.get(data.financial_stress, 0)
+@lru_cache(maxsize=4096)
+def _cached_predict(vec_tuple: tuple, generation: int) -> Optional[dict]:
+    """
+    Memoized model inference for /raw, keyed on the exact feature tuple.
 
-    # Withdrawal consideration
-    if data.withdrawal_considered:
-        risk_score += 15
+    Repeat requests (polling, A/B sweeps) skip the scaler + ensemble pass
+    entirely. The model generation is part of the key, so a reloaded
+    model naturally misses instead of serving stale predictions.
+    """
+    return ml_model.predict(list(vec_tuple))
 
-    # Performance satisfaction (inverse)
-    risk_score += max(0, 10 - data.performance_satisfaction) * 2
-
-    # Advisor interaction (inverse - less interaction = higher risk)
-    advisor_scores = {
-        'never': 10, 'once-semester': 5, '2-3-semester': 2, 'monthly': 0
-    }
-    risk_score += advisor_scores.get(data.advisor_interaction, 0)
-    
-    # Support network strength (inverse - weaker = higher risk)
-    risk_score += max(0, 10 - data.support_network_strength)
-    
-    # Extracurricular hours (too much or too little is risky)
-    if data.extracurricular_hours < 1 or data.extracurricular_hours > 15:
-        risk_score += 5
-    
-    # Career alignment (poor alignment = higher risk)
-    risk_score += max(0, 10 - data.career_alignment) * 1.5
-    
-    # Employment status (full-time while studying increases risk)
-    if data.employment_status == 'full-time':
-        risk_score += 10
-    elif data.employment_status == 'part-time':
-        risk_score += 5
 
-    # Normalize to 0-100
-    risk_score = min(100, max(0, risk_score))
+def _build_factors_and_recs(data: SimplifiedAssessmentRequest, risk_level: str):
+    """
+    Build the risk-factor and recommendation lists for an assessment.
+
+    Shared by the ML and fallback paths, which previously carried
+    copy-pasted variants of this block. Returns (risk_factors,
+    recommendations) with factors already filtered for the risk level.
+    """
+    # Conditions consulted by both the factor and recommendation rules,
+    # evaluated once per request
+    fin_stress_high = data.financial_stress in HIGH_FIN
+    works_full_time = data.employment_status == 'full-time'
+    no_services = not data.services_used
 
-    # Determine risk level
-    if risk_score >= 60:
-        risk_level = 'high'
-    elif risk_score >= 35:
-        risk_level = 'medium'
-    else:
-        risk_level = 'low'
-
-    # Generate risk factors
     risk_factors = []
-    if data.attendance in ['rarely', 'never']:
-        risk_factors.append(RiskFactor(
-            category="Academic",
-            factor="Low Class Attendance",
-            impact="high",
-            description="Inconsistent class attendance is strongly correlated with dropout risk"
-        ))
-
-    if data.overwhelm_frequency in ['often', 'always']:
-        risk_factors.append(RiskFactor(
-            category="Mental Health",
-            factor="Academic Overwhelm",
-            impact="high",
-            description="Feeling frequently overwhelmed can lead to burnout and withdrawal"
-        ))
-
-    if data.financial_stress in ['high', 'very-high']:
-        risk_factors.append(RiskFactor(
-            category="Financial",
-            factor="Financial Stress",
-            impact="high",
-            description="Financial difficulties are a leading cause of student withdrawal"
-        ))
+    if data.attendance in LOW_ATT:
+        risk_factors.append(STATIC_RISK_FACTORS['low_attendance'])
+
+    if data.overwhelm_frequency in HIGH_OVW:
+        risk_factors.append(STATIC_RISK_FACTORS['overwhelm'])
+
+    if fin_stress_high:
+        risk_factors.append(STATIC_RISK_FACTORS['financial_stress'])
 
     if data.withdrawal_considered:
-        risk_factors.append(RiskFactor(
-            category="Behavioral",
-            factor="Withdrawal Consideration",
-            impact="high",
-            description="Active consideration of withdrawal indicates elevated risk"
-        ))
-
-    # Filter risk factors based on overall risk level
-    risk_factors = filter_risk_factors_by_level(risk_factors, risk_level)
+        risk_factors.append(STATIC_RISK_FACTORS['withdrawal_considered'])
+
+    if data.support_network_strength <= 3:
+        risk_factors.append(STATIC_RISK_FACTORS['weak_support'])
+
+    if works_full_time:
+        risk_factors.append(STATIC_RISK_FACTORS['full_time_work'])
 
-    # Generate recommendations
     recommendations = []
     if risk_level == 'high':
-        recommendations.append(Recommendation(
-            type="counseling",
-            title="Mental Health Support",
-            description="Schedule an urgent appointment with a counselor to discuss your concerns and develop a support plan",
-            urgency="immediate",
-            contact="counseling@rvce.edu.in"
-        ))
-
-    if data.financial_stress in ['high', 'very-high']:
-        recommendations.append(Recommendation(
-            type="financial",
-            title="Financial Aid Office",
-            description="Connect with financial aid office to explore scholarships, grants, and emergency funding options",
-            urgency="soon",
-            contact="financialaid@rvce.edu.in"
-        ))
+        recommendations.append(STATIC_RECS['counseling'])
+
+    if fin_stress_high:
+        recommendations.append(STATIC_RECS['financial_aid'])
 
     if data.performance_satisfaction <= 4:
-        recommendations.append(Recommendation(
-            type="academic",
-            title="Academic Tutoring",
-            description="Access tutoring services and study groups to improve academic performance",
-            urgency="soon",
-            contact="tutoring@rvce.edu.in"
-        ))
-    
+        recommendations.append(STATIC_RECS['tutoring'])
+
+    if data.advisor_interaction in SPARSE_ADV:
+        recommendations.append(STATIC_RECS['advisor'])
+
+    if works_full_time:
+        recommendations.append(STATIC_RECS['time_management'])
+
+    # Handle withdrawal reasons if withdrawal is considered
+    if data.withdrawal_considered and data.withdrawal_reasons:
+        for reason in data.withdrawal_reasons:
+            i = WR_INDEX.get(reason)
+            if i is not None:
+                recommendations.append(WR_RECS[i])
+                risk_factors.append(WR_FACTORS[i])
+
+    # Filter risk factors based on overall risk level (after all factors collected)
+    risk_factors = filter_risk_factors_by_level(risk_factors, risk_level)
+
     # Services used - if no services used, add recommendation
-    if not data.services_used or len(data.services_used) == 0:
-        recommendations.append(Recommendation(
-            type="support",
-            title="Explore Campus Support Services",
-            description="You haven't indicated using any support services yet. Visit the student center to learn about available resources including academic advising, counseling, and health services.",
-            urgency="soon",
-            contact="studentcenter@rvce.edu.in"
-        ))
+    if no_services:
+        recommendations.append(STATIC_RECS['explore_services'])
 
     if not recommendations:
-        recommendations.append(Recommendation(
-            type="peer",
-            title="Stay Connected",
-            description="Continue engaging with campus resources and maintain your support network",
-            urgency="when-needed"
-        ))
-
-    return PredictionResponse(
+        recommendations.append(STATIC_RECS['stay_connected'])
+
+    return risk_factors, recommendations
+
+
+# Fallback scoring tables, hoisted from calculate_fallback_risk so each
+# request does plain dict lookups and integer additions instead of
+# rebuilding the score dicts. All weights are integers; the old
+# career-alignment weight of 1.5 is folded into a 0-15 table so the
+# score (and the risk_score response field) stays an int throughout.
+ATTENDANCE_SCORES = {'always': 0, 'often': 5, 'sometimes': 15, 'rarely': 25, 'never': 35}
+OVERWHELM_SCORES = {'never': 0, 'rarely': 5, 'sometimes': 10, 'often': 20, 'always': 30}
+FINANCIAL_SCORES = {'none': 0, 'low': 5, 'moderate': 10, 'high': 20, 'very-high': 25}
+ADVISOR_SCORES = {'never': 10, 'once-semester': 5, '2-3-semester': 2, 'monthly': 0}
+EMPLOYMENT_SCORES = {'not-employed': 0, 'part-time': 5, 'full-time': 10}
+# max(0, 10 - career_alignment) * 1.5, rounded down, for alignment 0-10
+CAREER_SCORES = (15, 13, 12, 10, 9, 7, 6, 4, 3, 1, 0)
+
+
+def _score_assessment(data: SimplifiedAssessmentRequest) -> int:
+    """
+    Pure-integer heuristic risk score (0-100) for the fallback path.
+
+    Table lookups plus int arithmetic only; no floats or per-call dict
+    construction, so the whole scoring pass is a handful of C-level ops.
+    """
+    risk_score = (
+        ATTENDANCE_SCORES.get(data.attendance, 0)
+        + OVERWHELM_SCORES.get(data.overwhelm_frequency, 0)
+        + FINANCIAL_SCORES.get(data.financial_stress, 0)
+        + ADVISOR_SCORES.get(data.advisor_interaction, 0)
+        + EMPLOYMENT_SCORES.get(data.employment_status, 0)
+        + max(0, 10 - data.performance_satisfaction) * 2
+        + max(0, 10 - data.support_network_strength)
+        + CAREER_SCORES[min(10, max(0, data.career_alignment))]
+    )
+
+    # Withdrawal consideration
+    if data.withdrawal_considered:
+        risk_score += 15
+
+    # Extracurricular hours (too much or too little is risky)
+    if data.extracurricular_hours < 1 or data.extracurricular_hours > 15:
+        risk_score += 5
+
+    # Normalize to 0-100
+    return min(100, risk_score)
+
+
+def calculate_fallback_risk(data: SimplifiedAssessmentRequest) -> PredictionResponse:
+    """Fallback prediction when ML model is not available"""
+    risk_score = _score_assessment(data)
+
+    # Determine risk level
+    risk_level = _LEVEL_TABLE[risk_score]
+
+    risk_factors, recommendations = _build_factors_and_recs(data, risk_level)
+
+    # model_construct skips re-validating values our own code just built
+    return PredictionResponse.model_construct(
         risk_level=risk_level,
         risk_score=risk_score,
         dropout_probability=risk_score / 100,
@@ -290,341 +536,112 @@ def calculate_fallback_risk(data: SimplifiedAssessmentRequest) -> PredictionResp
         prediction_confidence=0.75
     )
 
-@router.post("/simplified", response_model=PredictionResponse)
-async def predict_simplified(data: SimplifiedAssessmentRequest, db: AsyncSession = Depends(get_db)):
+def _build_ml_response(data: SimplifiedAssessmentRequest, pred: dict) -> PredictionResponse:
+    """Assemble the response for a successful ML prediction."""
+    dropout_probability = pred['dropout_probability']
+
+    # Determine risk level from the raw probability, before rounding
+    risk_score = int(round(dropout_probability * 100))
+    risk_level = risk_level_for(dropout_probability)
+
+    # Generate risk factors and recommendations from form inputs
+    risk_factors, recommendations = _build_factors_and_recs(data, risk_level)
+
+    return PredictionResponse.model_construct(
+        risk_level=risk_level,
+        risk_score=risk_score,
+        dropout_probability=dropout_probability,
+        predicted_class=pred['predicted_class'],
+        risk_factors=risk_factors,
+        recommendations=recommendations,
+        prediction_confidence=pred['model_confidence']
+    )
+
+
+# response_class pins orjson encoding for these hot routes even if the
+# app-level default ever changes
+@router.post("/simplified", response_model=PredictionResponse, response_class=ORJSONResponse)
+async def predict_simplified(data: SimplifiedAssessmentRequest):
     """
     Predict dropout risk based on simplified assessment.
     Uses ML model if available, falls back to heuristic otherwise.
     All form inputs are used in the prediction.
+    The prediction is persisted in the background.
+
+    No blanket try/except here: unexpected errors surface through
+    FastAPI's own 500 handler with a full traceback in the logs.
     """
-    try:
-        # Map all form inputs to ML features
-        ml_features = map_form_to_ml_features(data)
-        
-        # Try to use ML model first
-        if ml_model.is_loaded:
-            pred = ml_model.predict(ml_features)
-            if pred is not None:
-                dropout_probability = pred['dropout_probability']
-                predicted_class = pred['predicted_class']
-                prediction_confidence = pred['model_confidence']
-                
-                # Determine risk level based on probability
-                risk_score = int(round(dropout_probability * 100))
-                if dropout_probability >= 0.6:
-                    risk_level = 'high'
-                elif dropout_probability >= 0.35:
-                    risk_level = 'medium'
-                else:
-                    risk_level = 'low'
-                
-                # Generate risk factors based on form inputs
-                risk_factors = []
-                if data.attendance in ['rarely', 'never']:
-                    risk_factors.append(RiskFactor(
-                        category="Academic",
-                        factor="Low Class Attendance",
-                        impact="high",
-                        description="Inconsistent class attendance is strongly correlated with dropout risk"
-                    ))
-                
-                if data.overwhelm_frequency in ['often', 'always']:
-                    risk_factors.append(RiskFactor(
-                        category="Mental Health",
-                        factor="Academic Overwhelm",
-                        impact="high",
-                        description="Feeling frequently overwhelmed can lead to burnout and withdrawal"
-                    ))
-                
-                if data.financial_stress in ['high', 'very-high']:
-                    risk_factors.append(RiskFactor(
-                        category="Financial",
-                        factor="Financial Stress",
-                        impact="high",
-                        description="Financial difficulties are a leading cause of student withdrawal"
-                    ))
-                
-                if data.withdrawal_considered:
-                    risk_factors.append(RiskFactor(
-                        category="Behavioral",
-                        factor="Withdrawal Consideration",
-                        impact="high",
-                        description="Active consideration of withdrawal indicates elevated risk"
-                    ))
-                
-                if data.support_network_strength <= 3:
-                    risk_factors.append(RiskFactor(
-                        category="Social",
-                        factor="Weak Support Network",
-                        impact="medium",
-                        description="Limited social support increases vulnerability during challenges"
-                    ))
-                
-                if data.employment_status == 'full-time':
-                    risk_factors.append(RiskFactor(
-                        category="Personal",
-                        factor="Full-time Employment",
-                        impact="medium",
-                        description="Working full-time while studying significantly increases time pressure"
-                    ))
-
-                # Generate recommendations
-                recommendations = []
-                if risk_level == 'high':
-                    recommendations.append(Recommendation(
-                        type="counseling",
-                        title="Mental Health Support",
-                        description="Schedule an urgent appointment with a counselor to discuss your concerns and develop a support plan",
-                        urgency="immediate",
-                        contact="counseling@rvce.edu.in"
-                    ))
-                
-                if data.financial_stress in ['high', 'very-high']:
-                    recommendations.append(Recommendation(
-                        type="financial",
-                        title="Financial Aid Office",
-                        description="Connect with financial aid office to explore scholarships, grants, and emergency funding options",
-                        urgency="soon",
-                        contact="financialaid@rvce.edu.in"
-                    ))
-                
-                if data.performance_satisfaction <= 4:
-                    recommendations.append(Recommendation(
-                        type="academic",
-                        title="Academic Tutoring",
-                        description="Access tutoring services and study groups to improve academic performance",
-                        urgency="soon",
-                        contact="tutoring@rvce.edu.in"
-                    ))
-                
-                if data.advisor_interaction in ['never', 'once-semester']:
-                    recommendations.append(Recommendation(
-                        type="academic",
-                        title="Schedule Advisor Meeting",
-                        description="Regular meetings with your academic advisor can help with course planning and early problem detection",
-                        urgency="soon",
-                        contact="advising@rvce.edu.in"
-                    ))
-                
-                if data.employment_status == 'full-time':
-                    recommendations.append(Recommendation(
-                        type="peer",
-                        title="Time Management Support",
-                        description="Consider reducing work hours or exploring flexible work arrangements to prioritize your studies",
-                        urgency="soon"
-                    ))
-                
-                # Handle withdrawal reasons if withdrawal is considered
-                if data.withdrawal_considered and data.withdrawal_reasons:
-                    withdrawal_reason_map = {
-                        'Academic difficulty': {
-                            'recommendation': Recommendation(
-                                type="academic",
-                                title="Academic Support Program",
-                                description="Enroll in our comprehensive academic support program with tutoring, study groups, and study skills workshops",
-                                urgency="immediate",
-                                contact="academicsupport@rvce.edu.in"
-                            ),
-                            'risk_factor': RiskFactor(
-                                category="Academic",
-                                factor="Academic Difficulty",
-                                impact="high",
-                                description="Struggling with academic material can lead to course failure and withdrawal"
-                            )
-                        },
-                        'Financial challenges': {
-                            'recommendation': Recommendation(
-                                type="financial",
-                                title="Emergency Financial Assistance",
-                                description="Apply for emergency grants or loans. Meet with financial counselor to create a sustainable plan",
-                                urgency="immediate",
-                                contact="financialaid@rvce.edu.in"
-                            ),
-                            'risk_factor': RiskFactor(
-                                category="Financial",
-                                factor="Financial Crisis",
-                                impact="high",
-                                description="Severe financial issues are a primary driver of student withdrawal"
-                            )
-                        },
-                        'Mental health': {
-                            'recommendation': Recommendation(
-                                type="counseling",
-                                title="Mental Health Crisis Support",
-                                description="Contact counseling center immediately. We also have peer support groups and crisis resources available",
-                                urgency="immediate",
-                                contact="counseling@rvce.edu.in"
-                            ),
-                            'risk_factor': RiskFactor(
-                                category="Mental Health",
-                                factor="Mental Health Crisis",
-                                impact="high",
-                                description="Mental health challenges require immediate professional support and intervention"
-                            )
-                        },
-                        'Personal/family issues': {
-                            'recommendation': Recommendation(
-                                type="support",
-                                title="Personal Counseling & Family Support",
-                                description="Our counselors can help you navigate personal and family challenges while maintaining your academic progress",
-                                urgency="soon",
-                                contact="counseling@rvce.edu.in"
-                            ),
-                            'risk_factor': RiskFactor(
-                                category="Personal",
-                                factor="Personal/Family Crisis",
-                                impact="high",
-                                description="Personal and family issues can significantly impact academic focus and commitment"
-                            )
-                        },
-                        'Lack of interest': {
-                            'recommendation': Recommendation(
-                                type="academic",
-                                title="Academic Advising & Program Exploration",
-                                description="Meet with academic advisor to explore program alternatives, course selections, or potential major changes",
-                                urgency="soon",
-                                contact="advising@rvce.edu.in"
-                            ),
-                            'risk_factor': RiskFactor(
-                                category="Academic",
-                                factor="Loss of Academic Interest",
-                                impact="high",
-                                description="Declining interest in studies suggests misalignment with chosen program or career path"
-                            )
-                        },
-                        'Career opportunities': {
-                            'recommendation': Recommendation(
-                                type="career",
-                                title="Career Planning & Education Strategy",
-                                description="Explore how to balance career opportunities with completing your degree. Many students pursue internships while studying",
-                                urgency="soon",
-                                contact="career@rvce.edu.in"
-                            ),
-                            'risk_factor': RiskFactor(
-                                category="Career",
-                                factor="Career Path Conflict",
-                                impact="medium",
-                                description="External career opportunities may be pulling focus away from academic commitments"
-                            )
-                        }
-                    }
-                    
-                    for reason in data.withdrawal_reasons:
-                        if reason in withdrawal_reason_map:
-                            recommendations.append(withdrawal_reason_map[reason]['recommendation'])
-                            risk_factors.append(withdrawal_reason_map[reason]['risk_factor'])
-
-                # Filter risk factors based on overall risk level (after all factors collected)
-                risk_factors = filter_risk_factors_by_level(risk_factors, risk_level)
-
-                # Services used - if no services used, add recommendation
-                if not data.services_used or len(data.services_used) == 0:
-                    recommendations.append(Recommendation(
-                        type="support",
-                        title="Explore Campus Support Services",
-                        description="You haven't indicated using any support services yet. Visit the student center to learn about available resources including academic advising, counseling, and health services.",
-                        urgency="soon",
-                        contact="studentcenter@rvce.edu.in"
-                    ))
-                
-                if not recommendations:
-                    recommendations.append(Recommendation(
-                        type="peer",
-                        title="Stay Connected",
-                        description="Continue engaging with campus resources and maintain your support network",
-                        urgency="when-needed"
-                    ))
-
-                result = PredictionResponse(
-                    risk_level=risk_level,
-                    risk_score=risk_score,
-                    dropout_probability=dropout_probability,
-                    predicted_class=predicted_class,
-                    risk_factors=risk_factors,
-                    recommendations=recommendations,
-                    prediction_confidence=prediction_confidence
-                )
-
-                # Save prediction to database (non-blocking, log errors)
-                try:
-                    await save_prediction(db, result, data, endpoint="simplified")
-                except Exception as db_error:
-                    print(f"Database save failed: {db_error}")
-
-                return result
-
-        # Fall back to heuristic if ML model not available
-        result = calculate_fallback_risk(data)
+    result = None
+
+    # Try to use ML model first
+    if ml_model.is_loaded:
+        pred = await batch_predictor.submit(map_form_to_ml_features(data))
+        if pred is not None:
+            result = _build_ml_response(data, pred)
 
-        # Save fallback prediction to database
-        try:
-            await save_prediction(db, result, data, endpoint="simplified")
-        except Exception as db_error:
-            print(f"Database save failed: {db_error}")
+    # Fall back to heuristic if ML model not available
+    if result is None:
+        result = calculate_fallback_risk(data)
 
-        return result
+    # Save prediction to database off the response path
+    await _schedule_save(result, data, "simplified")
+
+    # Fast path: the healthy-student fallback payload is static except for
+    # the score and probability
+    if (result.predicted_class is None
+            and result.risk_level == 'low'
+            and not result.risk_factors
+            and result.recommendations == _STAY_CONNECTED_ONLY):
+        return Response(
+            content=_LOW_RISK_TEMPLATE % (result.risk_score, result.dropout_probability),
+            media_type="application/json"
+        )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+    return result
 
 
-@router.post("/raw", response_model=PredictionResponse)
-async def predict_raw(request: RawFeaturesRequest, db: AsyncSession = Depends(get_db)):
+@router.post("/raw", response_model=PredictionResponse, response_class=ORJSONResponse)
+async def predict_raw(request: RawFeaturesRequest):
     """Predict using raw feature dictionary matching training FEATURE_ORDER.
 
     Example request body:
       {"features": {"Curricular units 2nd sem (approved)": 3, ...}}
     """
-    try:
-        if not ml_model.is_loaded:
-            raise HTTPException(status_code=503, detail="ML model not loaded")
-
-        features_dict = request.features
-        # Validate presence of all required features
-        missing = [f for f in FEATURE_ORDER if f not in features_dict]
-        if missing:
-            raise HTTPException(status_code=400, detail=f"Missing feature keys: {missing}")
-
-        # Build feature vector in the correct order
-        feature_vector = [features_dict[f] for f in FEATURE_ORDER]
-
-        pred = ml_model.predict(feature_vector)
-        if pred is None:
-            raise HTTPException(status_code=500, detail="Model prediction failed")
-
-        dropout_probability = pred['dropout_probability']
-        predicted_class = pred['predicted_class']
-        model_confidence = pred['model_confidence']
-
-        # Determine risk level based on probability
-        risk_score = int(round(dropout_probability * 100))
-        if dropout_probability >= 0.6:
-            risk_level = 'high'
-        elif dropout_probability >= 0.35:
-            risk_level = 'medium'
-        else:
-            risk_level = 'low'
-
-        # Create prediction response
-        result = PredictionResponse(
-            risk_level=risk_level,
-            risk_score=risk_score,
-            dropout_probability=dropout_probability,
-            predicted_class=predicted_class,
-            risk_factors=[],  # No heuristic factors for raw ML prediction
-            recommendations=[], # To be expanded in future versions
-            prediction_confidence=model_confidence
-        )
+    if not ml_model.is_loaded:
+        raise HTTPException(status_code=503, detail="ML model not loaded")
+
+    features_dict = request.features
+    # Validate presence of all required features: one C-level subset test
+    # on the happy path, with the difference computed only for the error
+    if not FEATURE_SET <= features_dict.keys():
+        missing = FEATURE_SET - features_dict.keys()
+        raise HTTPException(status_code=400, detail=f"Missing feature keys: {sorted(missing)}")
+
+    # Build feature vector in the correct order
+    feature_vector = FEATURE_GETTER(features_dict)
+
+    pred = _cached_predict(feature_vector, ml_model.generation)
+    if pred is None:
+        raise HTTPException(status_code=500, detail="Model prediction failed")
 
-        # Save to database (without assessment input for raw endpoint)
-        try:
-            await save_prediction(db, result, None, endpoint="raw")
-        except Exception as db_error:
-            print(f"Database save failed: {db_error}")
+    dropout_probability = pred['dropout_probability']
+
+    # Determine risk level from the raw probability, before rounding
+    risk_score = int(round(dropout_probability * 100))
+    risk_level = risk_level_for(dropout_probability)
+
+    # Create prediction response
+    result = PredictionResponse.model_construct(
+        risk_level=risk_level,
+        risk_score=risk_score,
+        dropout_probability=dropout_probability,
+        predicted_class=pred['predicted_class'],
+        risk_factors=[],  # No heuristic factors for raw ML prediction
+        recommendations=[], # To be expanded in future versions
+        prediction_confidence=pred['model_confidence']
+    )
 
-        return result
+    # Save to database (without assessment input for raw endpoint)
+    await _schedule_save(result, None, "raw")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+    return result
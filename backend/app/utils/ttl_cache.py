@@ -0,0 +1,52 @@
+# backend/app/utils/ttl_cache.py
+import functools
+import time
+
+# Bumped after every successful prediction write. It is part of every cache
+# key, so dashboard caches invalidate as soon as new data lands instead of
+# waiting out their TTL.
+_stats_version = 0
+
+
+def bump_stats_version():
+    """Invalidate all TTL-cached dashboard reads (called after DB writes)."""
+    global _stats_version
+    _stats_version += 1
+
+
+def ttl_cache(seconds: float = 5.0):
+    """
+    TTL cache decorator for async repository functions.
+
+    The first positional argument (the database session) is excluded from
+    the cache key since it differs per request; the remaining arguments
+    plus the current stats version form the key.
+
+    Usage:
+        @ttl_cache(seconds=5)
+        async def get_dashboard_stats(db):
+            ...
+    """
+    def decorator(fn):
+        cache = {}
+
+        @functools.wraps(fn)
+        async def wrapper(db, *args, **kwargs):
+            key = (_stats_version, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            hit = cache.get(key)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+
+            value = await fn(db, *args, **kwargs)
+
+            # Prune entries from older versions or past their expiry
+            for old_key in list(cache):
+                if old_key[0] != _stats_version or cache[old_key][1] <= now:
+                    del cache[old_key]
+            cache[key] = (value, now + seconds)
+            return value
+
+        return wrapper
+    return decorator